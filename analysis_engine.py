@@ -1,4 +1,6 @@
 import re
+import json
+import hashlib
 
 # ==================================================
 # 1️⃣ SKILL TAXONOMY (NORMALIZED)
@@ -119,25 +121,40 @@ def infer_resume_role(resume_skills: set) -> str:
 # ==================================================
 # 5️⃣ EXPERIENCE SIGNALS (REAL WORK INDICATORS)
 # ==================================================
-def extract_experience_signals(resume_text: str) -> set:
-    keywords = [
-        "incident", "escalation", "sla", "ticket",
-        "dashboard", "reporting", "analysis",
-        "automation", "root cause", "monitoring",
-        "client handling", "stakeholder", "operations",
-        "troubleshooting", "process improvement"
-    ]
+EXPERIENCE_KEYWORDS = [
+    "incident", "escalation", "sla", "ticket",
+    "dashboard", "reporting", "analysis",
+    "automation", "root cause", "monitoring",
+    "client handling", "stakeholder", "operations",
+    "troubleshooting", "process improvement"
+]
+
 
+def extract_experience_signals(resume_text: str) -> set:
     text = clean_text(resume_text)
-    return {k for k in keywords if k in text}
+    return {k for k in EXPERIENCE_KEYWORDS if k in text}
+
+
+# ==================================================
+# TAXONOMY VERSION (FOR PERSISTED PROFILES)
+# ==================================================
+# Changes whenever any list above is edited or reordered, so stored
+# profiles / skill IDs built from an older taxonomy can be detected.
+TAXONOMY_VERSION = hashlib.sha1(json.dumps([
+    SKILL_SYNONYMS,
+    ROLE_KEYWORDS,
+    {role: sorted(skills) for role, skills in ROLE_EXPECTED_SKILLS.items()},
+    EXPERIENCE_KEYWORDS,
+]).encode("utf-8")).hexdigest()[:12]
 
 
 # ==================================================
 # 6️⃣ ATS ENGINE (BALANCED & EXPLAINABLE)
 # ==================================================
-def keyword_overlap(resume_text: str, jd_text: str):
+def keyword_overlap(resume_text: str, jd_text: str, jd_words: set = None):
     resume_words = set(clean_text(resume_text).split())
-    jd_words = set(clean_text(jd_text).split())
+    if jd_words is None:
+        jd_words = set(clean_text(jd_text).split())
     return len(resume_words & jd_words), len(jd_words)
 
 
@@ -154,16 +171,30 @@ def recommend_job_fit(resume_skills: set, jd_skills: set) -> str:
     return "Weak Fit"
 
 
-def calculate_ats_score(resume_text: str, jd_text: str):
+def build_jd_profile(jd_text: str) -> dict:
+    """
+    Everything the ATS score needs from the JD side.
+    Depends only on the JD, so it can be computed once and reused.
+    """
+    jd_role = detect_jd_role(jd_text)
+    jd_skills = extract_skills(jd_text) | ROLE_EXPECTED_SKILLS.get(jd_role, set())
+
+    return {
+        "jd_role": jd_role,
+        "jd_skills": jd_skills,
+        "jd_words": set(clean_text(jd_text).split()),
+    }
+
+
+def calculate_ats_score(resume_text: str, jd_text: str, jd_profile: dict = None):
+    jd_profile = jd_profile or build_jd_profile(jd_text)
+
     resume_skills = extract_skills(resume_text)
-    jd_skills = extract_skills(jd_text)
+    jd_skills = set(jd_profile["jd_skills"])
 
-    jd_role = detect_jd_role(jd_text)
+    jd_role = jd_profile["jd_role"]
     resume_role = infer_resume_role(resume_skills)
 
-    core_skills = ROLE_EXPECTED_SKILLS.get(jd_role, set())
-    jd_skills |= core_skills
-
     matched = resume_skills & jd_skills
     missing = jd_skills - resume_skills
 
@@ -171,7 +202,7 @@ def calculate_ats_score(resume_text: str, jd_text: str):
     skill_score = (len(matched) / max(len(jd_skills), 1)) * 50
 
     # ---- Keyword relevance (30)
-    common, total = keyword_overlap(resume_text, jd_text)
+    common, total = keyword_overlap(resume_text, jd_text, jd_profile["jd_words"])
     keyword_score = (common / max(total, 1)) * 30
 
     # ---- Resume completeness (10–20)
@@ -1,8 +1,12 @@
-from flask import Flask, render_template, request, redirect, url_for, session
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify
 from resume_parser import extract_resume_text
 from gemini_service import analyze_resume
+from circuit_breaker import breaker_status
 from jd_parser import extract_jd_from_url, extract_jd_from_pdf
+from jd_profile import JDProfileStore, transient_profile
+from requests import HTTPError
 import os
+import hmac
 
 
 app = Flask(__name__)
@@ -14,6 +18,9 @@ app.secret_key = "resume_ai_secret_key"
 UPLOAD_RESUME_PATH = "uploaded_resume.pdf"
 UPLOAD_JD_PATH = "uploaded_jd.pdf"
 
+# Publishing shareable JDs is disabled unless a token is configured
+JD_PUBLISH_TOKEN = os.environ.get("JD_PUBLISH_TOKEN")
+
 
 # -------------------------
 # Home page
@@ -31,6 +38,7 @@ def analyze():
     if request.method == "POST":
 
         resume = request.files.get("resume")
+        jd_id = request.form.get("jd_id", "").strip()
         jd_url = request.form.get("jd_url", "").strip()
         jd_text = request.form.get("job_description", "").strip()
         jd_pdf = request.files.get("jd_pdf")
@@ -50,18 +58,31 @@ def analyze():
 
             # -------------------------
             # Determine JD source priority
+            # (shared / cached profiles skip fetching + parsing;
+            #  pasted / uploaded JDs are never stored)
             # -------------------------
-            job_desc = ""
-
-            if jd_url:
-                job_desc = extract_jd_from_url(jd_url)
+            jd_profile = None
+
+            if jd_id or jd_url:
+                jd_store = JDProfileStore()
+                try:
+                    if jd_id:
+                        jd_profile = jd_store.get(jd_id)
+                        if not jd_profile:
+                            raise ValueError("Shared job description not found")
+                    else:
+                        jd_profile = jd_store.get_by_url(jd_url)
+                        if not jd_profile:
+                            jd_profile = jd_store.save(extract_jd_from_url(jd_url), url=jd_url)
+                finally:
+                    jd_store.close()
 
             elif jd_pdf:
                 jd_pdf.save(UPLOAD_JD_PATH)
-                job_desc = extract_jd_from_pdf(UPLOAD_JD_PATH)
+                jd_profile = transient_profile(extract_jd_from_pdf(UPLOAD_JD_PATH))
 
             elif jd_text:
-                job_desc = jd_text
+                jd_profile = transient_profile(jd_text)
 
             else:
                 raise ValueError("No job description provided")
@@ -69,7 +90,7 @@ def analyze():
             # -------------------------
             # Analyze
             # -------------------------
-            result = analyze_resume(resume_text, job_desc)
+            result = analyze_resume(resume_text, jd_profile["jd_text"], jd_profile)
 
             session["result"] = result
             print("✅ RESULT GENERATED")
@@ -97,7 +118,45 @@ def analyze():
 
         return redirect(url_for("results"))
 
-    return render_template("index.html")
+    return render_template("index.html", jd_id=request.args.get("jd", ""))
+
+
+# -------------------------
+# Publish a JD (shareable analyze link)
+# -------------------------
+@app.route("/jd/publish", methods=["POST"])
+def publish_jd():
+    token = request.headers.get("X-Publish-Token", "")
+    if not JD_PUBLISH_TOKEN or not hmac.compare_digest(token, JD_PUBLISH_TOKEN):
+        return jsonify({"error": "Publishing requires a valid X-Publish-Token"}), 403
+
+    data = request.get_json(silent=True) or request.form
+    jd_url = (data.get("jd_url") or "").strip()
+    jd_text = (data.get("job_description") or "").strip()
+
+    if not jd_url and not jd_text:
+        return jsonify({"error": "Provide jd_url or job_description"}), 400
+
+    jd_store = JDProfileStore()
+    try:
+        if jd_url:
+            jd_profile = jd_store.get_by_url(jd_url) or jd_store.save(extract_jd_from_url(jd_url), url=jd_url)
+        else:
+            jd_profile = jd_store.save(jd_text)
+    except (ValueError, HTTPError) as e:
+        # Empty page / auth wall / 4xx-5xx from the JD link — nothing is stored
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        print("❌ JD PUBLISH ERROR:", e)
+        return jsonify({"error": str(e)}), 502
+    finally:
+        jd_store.close()
+
+    return jsonify({
+        "jd_id": jd_profile["jd_id"],
+        "jd_role": jd_profile["jd_role"],
+        "share_url": url_for("analyze", jd=jd_profile["jd_id"], _external=True),
+    })
 
 
 # -------------------------
@@ -125,6 +184,14 @@ def tailor():
     return render_template("tailor.html", result=result)
 
 
+# -------------------------
+# Upstream health (circuit breakers)
+# -------------------------
+@app.route("/health/upstreams")
+def upstream_health():
+    return jsonify(breaker_status())
+
+
 # -------------------------
 # App runner (local + Render)
 # -------------------------
@@ -0,0 +1,198 @@
+import time
+import threading
+from collections import deque
+
+# ==================================================
+# STATES
+# ==================================================
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an upstream whose breaker is open.
+    """
+
+
+# ==================================================
+# CIRCUIT BREAKER
+# ==================================================
+class CircuitBreaker:
+    """
+    Tracks the last `window` calls to one upstream.
+
+    - Errors and calls slower than `slow_call_seconds` count as bad
+    - Opens when the bad-call rate reaches `failure_rate`
+      (once at least `min_calls` are recorded)
+    - After `cooldown_seconds` lets ONE probe through (half-open):
+      success closes the breaker, failure re-opens it
+    - While open, calls are shed immediately and counted
+    """
+
+    def __init__(self, name: str, window: int = 20, min_calls: int = 5,
+                 failure_rate: float = 0.5, slow_call_seconds: float = 5.0,
+                 cooldown_seconds: float = 30.0, clock=time.monotonic):
+        self.name = name
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.clock = clock
+
+        self._calls = deque(maxlen=window)  # (latency_seconds, ok)
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+        self.shed_count = 0
+        self.open_count = 0
+
+    # -------------------------
+    # State
+    # -------------------------
+    def _current_state(self) -> str:
+        if self._state == OPEN and self.clock() - self._opened_at >= self.cooldown_seconds:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _open(self):
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._probe_in_flight = False
+        self.open_count += 1
+        print(f"⚡ Circuit OPEN: {self.name}")
+
+    def _close(self):
+        self._state = CLOSED
+        self._calls.clear()
+        self._probe_in_flight = False
+        print(f"✅ Circuit CLOSED: {self.name}")
+
+    # -------------------------
+    # Admission
+    # -------------------------
+    def _admit(self):
+        """
+        None if shed, else "call" or "probe" (the single half-open trial).
+        """
+        with self._lock:
+            state = self._current_state()
+
+            if state == CLOSED:
+                return "call"
+
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return "probe"
+
+            self.shed_count += 1
+            return None
+
+    def allow(self) -> bool:
+        """
+        True if the caller may hit the upstream now.
+        A False result is counted as a shed call.
+        If this admitted the half-open probe, report its outcome
+        with record(..., probe=True).
+        """
+        return self._admit() is not None
+
+    # -------------------------
+    # Outcomes
+    # -------------------------
+    def record(self, latency: float, ok: bool, probe: bool = False):
+        ok = ok and latency < self.slow_call_seconds
+
+        with self._lock:
+            state = self._current_state()
+
+            if state == HALF_OPEN:
+                # Only the admitted probe decides — ignore stragglers
+                # admitted before the breaker opened
+                if not probe:
+                    return
+                if ok:
+                    self._close()
+                else:
+                    self._open()
+                return
+
+            if state == OPEN:
+                # Late result from a call admitted before the breaker opened
+                return
+
+            self._calls.append((latency, ok))
+            if len(self._calls) < self.min_calls:
+                return
+
+            bad = sum(1 for _, good in self._calls if not good)
+            if bad / len(self._calls) >= self.failure_rate:
+                self._open()
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Run fn through the breaker.
+        Raises CircuitOpenError without calling fn when shedding.
+        """
+        admission = self._admit()
+        if admission is None:
+            raise CircuitOpenError(f"{self.name} circuit is open")
+
+        probe = admission == "probe"
+        start = self.clock()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            # BaseException too, so an interrupted probe can't wedge half-open
+            self.record(self.clock() - start, ok=False, probe=probe)
+            raise
+
+        self.record(self.clock() - start, ok=True, probe=probe)
+        return result
+
+    # -------------------------
+    # Introspection
+    # -------------------------
+    def snapshot(self) -> dict:
+        with self._lock:
+            calls = list(self._calls)
+            state = self._current_state()
+
+        latencies = [lat for lat, _ in calls]
+
+        return {
+            "state": state,
+            "recent_calls": len(calls),
+            "failure_rate": round(sum(1 for _, ok in calls if not ok) / max(len(calls), 1), 2),
+            "avg_latency": round(sum(latencies) / max(len(latencies), 1), 3),
+            "shed_count": self.shed_count,
+            "open_count": self.open_count,
+        }
+
+
+# ==================================================
+# REGISTRY (ONE BREAKER PER UPSTREAM)
+# ==================================================
+BREAKERS = {}
+
+
+def get_breaker(name: str, **settings) -> CircuitBreaker:
+    """
+    Return the shared breaker for `name`, creating it on first use.
+    """
+    if name not in BREAKERS:
+        BREAKERS[name] = CircuitBreaker(name, **settings)
+    return BREAKERS[name]
+
+
+def breaker_status() -> dict:
+    return {name: b.snapshot() for name, b in BREAKERS.items()}
@@ -5,8 +5,10 @@ from dotenv import load_dotenv
 from google import genai
 
 from analysis_engine import calculate_ats_score
-from job_fetcher import fetch_jobs
-from job_matcher import rank_jobs
+from circuit_breaker import get_breaker, CircuitOpenError
+from job_fetcher import fetch_jobs, cached_jobs, AdzunaNotConfiguredError
+from job_matcher import rank_jobs, rank_stored_jobs, merge_ranked
+from job_store import JobStore, DEFAULT_STORE_PATH
 
 # ==================================================
 # ENV SETUP
@@ -15,6 +17,9 @@ BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 load_dotenv(os.path.join(BASE_DIR, ".env"))
 API_KEY = os.getenv("GOOGLE_API_KEY")
 
+GEMINI_TIMEOUT_MS = 20000
+GEMINI_BREAKER = get_breaker("gemini", slow_call_seconds=15.0, cooldown_seconds=60.0)
+
 # ==================================================
 # SAFE JSON EXTRACTOR
 # ==================================================
@@ -102,8 +107,12 @@ Job Description:
 """
 
     try:
-        client = genai.Client(api_key=API_KEY)
-        response = client.models.generate_content(
+        client = genai.Client(
+            api_key=API_KEY,
+            http_options={"timeout": GEMINI_TIMEOUT_MS}
+        )
+        response = GEMINI_BREAKER.call(
+            client.models.generate_content,
             model="gemini-2.5-flash",
             contents=prompt
         )
@@ -119,27 +128,98 @@ Job Description:
             "improvements": data.get("improvements", [])
         }
 
+    except CircuitOpenError:
+        print("⚡ Gemini degraded — skipping AI insights")
+        return {"strengths": [], "improvements": [], "degraded": True}
+
     except Exception as e:
+        # Timeout / upstream error / bad JSON — the request gets the fallback too
         print("🔥 Gemini Error:", e)
-        return {"strengths": [], "improvements": []}
+        return {"strengths": [], "improvements": [], "degraded": True}
+
+
+# ==================================================
+# JOB RECOMMENDATIONS (LIVE + JOB STORE)
+# ==================================================
+# Newest stored jobs scored per request — keeps /analyze fast on a
+# multi-million-row store
+STORE_SCAN_LIMIT = 2000
+
+
+def stored_job_matches(resume_text: str, resume_role: str):
+    """
+    Rank the offline job store (job_ingest.py), if one exists.
+    Never raises — a missing, stale or corrupt store just yields [].
+    """
+    if not os.path.exists(DEFAULT_STORE_PATH):
+        return []
+
+    try:
+        store = JobStore(DEFAULT_STORE_PATH, read_only=True)
+    except Exception as e:
+        print("⚠️ Job store skipped:", e)
+        return []
+
+    try:
+        return rank_stored_jobs(resume_text, store.iter_jobs(resume_role, limit=STORE_SCAN_LIMIT))
+    except Exception as e:
+        print("⚠️ Job store error:", e)
+        return []
+    finally:
+        store.close()
+
+
+def recommend_jobs(resume_text: str, resume_role: str):
+    """
+    Returns (jobs, degraded).
+    Live Adzuna results are merged with the job store.
+    If Adzuna is shed or fails, the last cached fetch stands in for live results.
+    """
+    degraded = False
+
+    try:
+        jobs = fetch_jobs(resume_role)
+        print(f"💼 Jobs fetched: {len(jobs)}")
+    except AdzunaNotConfiguredError:
+        # Store-only recommendations — nothing is degraded
+        jobs = []
+    except CircuitOpenError:
+        print("⚡ Adzuna degraded — using cached jobs")
+        jobs, degraded = cached_jobs(resume_role), True
+    except Exception as e:
+        print("⚠️ Job recommendation error:", e)
+        jobs, degraded = cached_jobs(resume_role), True
+
+    try:
+        live = rank_jobs(resume_text, jobs)
+    except Exception as e:
+        print("⚠️ Job ranking error:", e)
+        live = []
+
+    recommended = merge_ranked(live, stored_job_matches(resume_text, resume_role))
+    print(f"💼 Recommended: {len(recommended)}")
+
+    return recommended, degraded
 
 
 # ==================================================
 # FINAL ORCHESTRATOR (SOURCE OF TRUTH)
 # ==================================================
-def analyze_resume(resume_text: str, job_description: str):
+def analyze_resume(resume_text: str, job_description: str, jd_profile: dict = None):
     """
     Guarantees:
     - Correct ATS score
     - Detailed improvement plan
     - Accurate summary stats
     - Resume-based job recommendations
+
+    jd_profile: prebuilt JD side (jd_profile.JDProfileStore) — skips JD parsing
     """
 
     # -------------------------
     # ATS SCORE (RULE-BASED)
     # -------------------------
-    stats = calculate_ats_score(resume_text, job_description)
+    stats = calculate_ats_score(resume_text, job_description, jd_profile)
 
     # -------------------------
     # AI INSIGHTS
@@ -206,13 +286,12 @@ def analyze_resume(resume_text: str, job_description: str):
     # JOB RECOMMENDATIONS (RESUME-BASED)
     # -------------------------
     recommended_jobs = []
+    jobs_degraded = False
 
     try:
         resume_role = stats.get("resume_role", "generic")
         if resume_role != "generic":
-            jobs = fetch_jobs(resume_role)
-            recommended_jobs = rank_jobs(resume_text, jobs)
-            print(f"💼 Jobs fetched: {len(jobs)} | Recommended: {len(recommended_jobs)}")
+            recommended_jobs, jobs_degraded = recommend_jobs(resume_text, resume_role)
     except Exception as e:
         print("⚠️ Job recommendation error:", e)
 
@@ -232,5 +311,11 @@ def analyze_resume(resume_text: str, job_description: str):
         "ai_improvements": improvements,
         "improvement_stats": improvement_stats,
 
-        "recommended_jobs": recommended_jobs
+        "recommended_jobs": recommended_jobs,
+
+        # Upstreams skipped or served from fallback for this request
+        "degraded": {
+            "gemini": ai.get("degraded", False),
+            "adzuna": jobs_degraded,
+        }
     }
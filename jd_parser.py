@@ -4,6 +4,8 @@ import PyPDF2
 
 def extract_jd_from_url(url):
     response = requests.get(url, timeout=10)
+    # Auth walls / 403 / 429 must not be parsed (and cached) as a JD
+    response.raise_for_status()
     soup = BeautifulSoup(response.text, "html.parser")
     text = " ".join(p.get_text() for p in soup.find_all("p"))
     return text.strip()
@@ -0,0 +1,183 @@
+import os
+import time
+import sqlite3
+import hashlib
+
+from analysis_engine import build_jd_profile, TAXONOMY_VERSION
+from job_store import SKILL_NAMES, SKILL_IDS, encode_ids, decode_ids
+
+# ==================================================
+# STORE LOCATION & LIMITS
+# ==================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_JD_STORE_PATH = os.path.join(BASE_DIR, "jd_profiles.db")
+
+# Careers pages change — refetch a URL once its profile is older than this
+URL_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+# Published / fetched profiles are dropped after this (share links expire)
+PROFILE_MAX_AGE_SECONDS = 30 * 24 * 3600
+MAX_PROFILES = 5000
+MAX_JD_CHARS = 100000
+
+
+def jd_hash(jd_text: str) -> str:
+    """
+    Whitespace / case-insensitive content hash — used as the shareable JD id
+    """
+    return hashlib.sha1(" ".join(jd_text.lower().split()).encode("utf-8")).hexdigest()
+
+
+def transient_profile(jd_text: str) -> dict:
+    """
+    Profile for a pasted / uploaded JD — same shape as a stored one, never persisted.
+    """
+    profile = build_jd_profile(jd_text)
+    profile.update({"jd_id": jd_hash(jd_text), "url": None, "jd_text": jd_text, "updated_at": None})
+    return profile
+
+
+# ==================================================
+# SQLITE STORE
+# ==================================================
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jd_profiles (
+    jd_id      TEXT PRIMARY KEY,
+    url        TEXT,
+    jd_text    TEXT,
+    jd_role    TEXT,
+    skill_ids  BLOB,
+    jd_words   TEXT,
+    updated_at REAL,
+    taxonomy   TEXT
+)
+"""
+
+INDEX = "CREATE INDEX IF NOT EXISTS jd_profiles_url ON jd_profiles (url)"
+
+SELECT = "SELECT jd_id, url, jd_text, jd_role, skill_ids, jd_words, updated_at, taxonomy FROM jd_profiles"
+
+
+class JDProfileStore:
+    """
+    Persisted JD profiles, keyed by content hash (jd_id) and source URL.
+    Only published or URL-fetched JDs are saved; old rows are pruned on save.
+    """
+
+    def __init__(self, path: str = DEFAULT_JD_STORE_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.execute(INDEX)
+
+        # Stores created before taxonomy tracking — rows rebuild on next read
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(jd_profiles)")}
+        if "taxonomy" not in columns:
+            self.conn.execute("ALTER TABLE jd_profiles ADD COLUMN taxonomy TEXT")
+
+        self.conn.commit()
+
+    def _to_profile(self, row) -> dict:
+        jd_id, url, jd_text, jd_role, skill_ids, jd_words, updated_at, taxonomy = row
+
+        if taxonomy != TAXONOMY_VERSION:
+            # Built with older skills / roles — rebuild so shared links
+            # score exactly like pasting the same JD
+            profile = build_jd_profile(jd_text)
+            self._write(jd_id, url, jd_text, profile, updated_at)
+            profile.update({"jd_id": jd_id, "url": url, "jd_text": jd_text, "updated_at": updated_at})
+            return profile
+
+        return {
+            "jd_id": jd_id,
+            "url": url,
+            "jd_text": jd_text,
+            "jd_role": jd_role,
+            "jd_skills": decode_ids(skill_ids, SKILL_NAMES),
+            "jd_words": set(jd_words.split()),
+            "updated_at": updated_at,
+        }
+
+    def _write(self, jd_id, url, jd_text, profile, updated_at):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO jd_profiles "
+            "(jd_id, url, jd_text, jd_role, skill_ids, jd_words, updated_at, taxonomy) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                jd_id, url, jd_text, profile["jd_role"],
+                encode_ids(profile["jd_skills"], SKILL_IDS),
+                " ".join(sorted(profile["jd_words"])),
+                updated_at, TAXONOMY_VERSION,
+            ),
+        )
+        self.conn.commit()
+
+    def get(self, jd_id: str, max_age: float = PROFILE_MAX_AGE_SECONDS):
+        row = self.conn.execute(f"{SELECT} WHERE jd_id = ?", (jd_id,)).fetchone()
+
+        if not row or time.time() - row[6] > max_age:
+            return None
+        return self._to_profile(row)
+
+    def get_by_url(self, url: str, max_age: float = URL_MAX_AGE_SECONDS):
+        row = self.conn.execute(
+            f"{SELECT} WHERE url = ? ORDER BY updated_at DESC LIMIT 1", (url,)
+        ).fetchone()
+
+        if not row or time.time() - row[6] > max_age:
+            return None
+        return self._to_profile(row)
+
+    def save(self, jd_text: str, url: str = None) -> dict:
+        """
+        Build and persist the profile for a published or URL-fetched JD.
+        Re-saving an existing JD reuses its profile and refreshes its age.
+        """
+        if not jd_text or not jd_text.strip():
+            # e.g. a careers page with no <p> text — don't cache it for the URL
+            raise ValueError("Job description is empty")
+
+        if len(jd_text) > MAX_JD_CHARS:
+            raise ValueError(f"Job description too long (max {MAX_JD_CHARS} characters)")
+
+        jd_id = jd_hash(jd_text)
+        now = time.time()
+        existing = self.get(jd_id, max_age=float("inf"))
+
+        if existing:
+            url = url or existing["url"]
+            self.conn.execute(
+                "UPDATE jd_profiles SET url = ?, updated_at = ? WHERE jd_id = ?",
+                (url, now, jd_id),
+            )
+            self.conn.commit()
+            existing.update({"url": url, "updated_at": now})
+            return existing
+
+        profile = build_jd_profile(jd_text)
+        self._write(jd_id, url, jd_text, profile, now)
+        self.prune(now)
+
+        profile.update({"jd_id": jd_id, "url": url, "jd_text": jd_text, "updated_at": now})
+        return profile
+
+    def prune(self, now: float = None):
+        """
+        Drop expired profiles, then the oldest beyond MAX_PROFILES.
+        """
+        now = now or time.time()
+        self.conn.execute(
+            "DELETE FROM jd_profiles WHERE updated_at < ?", (now - PROFILE_MAX_AGE_SECONDS,)
+        )
+        self.conn.execute(
+            "DELETE FROM jd_profiles WHERE jd_id NOT IN "
+            "(SELECT jd_id FROM jd_profiles ORDER BY updated_at DESC LIMIT ?)",
+            (MAX_PROFILES,),
+        )
+        self.conn.commit()
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jd_profiles").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
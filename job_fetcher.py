@@ -2,6 +2,8 @@ import requests
 import os
 from dotenv import load_dotenv
 
+from circuit_breaker import get_breaker
+
 load_dotenv()
 
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID")
@@ -17,13 +19,33 @@ ROLE_QUERY_MAP = {
     "support": "technical support engineer",
 }
 
+ADZUNA_BREAKER = get_breaker("adzuna", slow_call_seconds=5.0, cooldown_seconds=30.0)
+
+# Last successful result per (role, country) — served while Adzuna is shed
+_JOB_CACHE = {}
+
+
+class AdzunaNotConfiguredError(ValueError):
+    """
+    Credentials missing — a setup issue, not upstream degradation.
+    """
+
+
+def _get(url, params):
+    # raise_for_status inside the breaker so 429 / 5xx count as failures
+    response = requests.get(url, params=params, timeout=10)
+    print("🔗 Adzuna URL:", response.url)
+    print("📡 Adzuna Status:", response.status_code)
+    response.raise_for_status()
+    return response
+
 
 def fetch_jobs(role: str, country: str = "in", page: int = 1, results_per_page: int = 20):
     """
     Fetch latest jobs from Adzuna based on RESUME role.
     """
     if not ADZUNA_APP_ID or not ADZUNA_API_KEY:
-        raise ValueError("Adzuna credentials not set")
+        raise AdzunaNotConfiguredError("Adzuna credentials not set")
 
     role_query = ROLE_QUERY_MAP.get(role, role)
 
@@ -37,14 +59,18 @@ def fetch_jobs(role: str, country: str = "in", page: int = 1, results_per_page:
         "sort_by": "date"
     }
 
-    response = requests.get(url, params=params, timeout=10)
-
-    print("🔗 Adzuna URL:", response.url)
-    print("📡 Adzuna Status:", response.status_code)
-
-    response.raise_for_status()
+    # Raises CircuitOpenError right away while Adzuna is degraded
+    response = ADZUNA_BREAKER.call(_get, url, params)
 
     jobs = response.json().get("results", [])
     print("📦 Jobs returned:", len(jobs))
 
+    _JOB_CACHE[(role, country)] = jobs
     return jobs
+
+
+def cached_jobs(role: str, country: str = "in"):
+    """
+    Jobs from the last successful fetch for this role (empty if none).
+    """
+    return _JOB_CACHE.get((role, country), [])
@@ -0,0 +1,221 @@
+"""
+Offline bulk ingestion of job dumps (JSONL / CSV) into the local job store.
+
+Usage:
+    python job_ingest.py postings.jsonl [--store job_store.db] [--workers 4]
+"""
+import os
+import csv
+import sys
+import json
+import time
+import argparse
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+
+from analysis_engine import extract_skills, extract_experience_signals, detect_jd_role
+from job_store import (
+    JobStore, DEFAULT_STORE_PATH, SKILL_IDS, EXPERIENCE_IDS,
+    encode_ids, content_hash,
+)
+
+# Large descriptions in CSV exports overflow the default 128KB field limit
+csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+
+
+# ==================================================
+# 1️⃣ STREAMING READERS
+# ==================================================
+def _text(value) -> str:
+    return "" if value is None else str(value)
+
+
+def _display_name(value) -> str:
+    # Adzuna nests company / location as {"display_name": ...}
+    if isinstance(value, dict):
+        value = value.get("display_name")
+    return _text(value)
+
+
+def normalize_posting(raw: dict) -> dict:
+    """
+    Coerce every field to str — dumps contain numbers / nulls in text columns.
+    """
+    return {
+        "title": _text(raw.get("title")),
+        "company": _display_name(raw.get("company")),
+        "location": _display_name(raw.get("location")),
+        "url": _text(raw.get("redirect_url") or raw.get("url")),
+        "description": _text(raw.get("description")),
+    }
+
+
+def iter_postings(path: str, stats: dict = None):
+    """
+    Yield one normalized posting at a time — never reads the whole file.
+    Undecodable / malformed lines and bad CSV rows are skipped and
+    counted in stats["malformed"].
+    """
+    stats = stats if stats is not None else {}
+    stats.setdefault("malformed", 0)
+
+    if path.lower().endswith(".csv"):
+        # Bad bytes become U+FFFD instead of aborting the run
+        with open(path, newline="", encoding="utf-8", errors="replace") as f:
+            reader = csv.DictReader(f)
+            while True:
+                try:
+                    row = next(reader)
+                except StopIteration:
+                    return
+                except csv.Error:
+                    stats["malformed"] += 1
+                    continue
+                yield normalize_posting(row)
+
+    # JSONL: decode per line so one bad byte only costs that line
+    with open(path, "rb") as f:
+        for raw_line in f:
+            try:
+                line = raw_line.decode("utf-8").strip()
+            except UnicodeDecodeError:
+                stats["malformed"] += 1
+                continue
+            if not line:
+                continue
+            try:
+                raw = json.loads(line)
+            except json.JSONDecodeError:
+                stats["malformed"] += 1
+                continue
+            if isinstance(raw, dict):
+                yield normalize_posting(raw)
+            else:
+                stats["malformed"] += 1
+
+
+def batched(iterable, size: int):
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ==================================================
+# 2️⃣ PROFILING (RUNS IN WORKER PROCESSES)
+# ==================================================
+def profile_posting(posting: dict) -> tuple:
+    title = posting["title"]
+    description = posting["description"]
+
+    return (
+        content_hash(title, posting["company"], description),
+        title,
+        posting["company"],
+        posting["location"],
+        posting["url"],
+        detect_jd_role(f"{title} {description}"),
+        encode_ids(extract_skills(description), SKILL_IDS),
+        encode_ids(extract_experience_signals(description), EXPERIENCE_IDS),
+    )
+
+
+def profile_batch(batch: list) -> tuple:
+    """
+    Returns (records, failed) — one bad posting must not abort the run.
+    """
+    records, failed = [], 0
+
+    for posting in batch:
+        try:
+            records.append(profile_posting(posting))
+        except Exception:
+            failed += 1
+
+    return records, failed
+
+
+# ==================================================
+# 3️⃣ PIPELINE
+# ==================================================
+def ingest(path: str, store_path: str = DEFAULT_STORE_PATH,
+           workers: int = None, batch_size: int = 500, report_every: int = 50000,
+           rebuild: bool = False):
+    """
+    Stream postings -> profile in a process pool -> dedupe into the store.
+
+    At most `workers * 2` batches are in flight at once, so memory stays
+    bounded regardless of input size.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 2
+
+    store = JobStore(store_path, rebuild=rebuild)
+    stats = {"malformed": 0, "failed": 0}
+    read = stored = 0
+    next_report = report_every
+    start = time.perf_counter()
+
+    def drain(result):
+        nonlocal stored, next_report
+        records, failed = result.get()
+        stats["failed"] += failed
+        stored += store.add_records(records)
+        if report_every and read >= next_report:
+            rate = read / max(time.perf_counter() - start, 1e-9)
+            print(f"⏳ {read} read | {stored} stored | {rate:.0f} postings/s")
+            next_report += report_every
+
+    try:
+        with Pool(workers) as pool:
+            pending = deque()
+
+            for batch in batched(iter_postings(path, stats), batch_size):
+                read += len(batch)
+                pending.append(pool.apply_async(profile_batch, (batch,)))
+
+                if len(pending) >= max_in_flight:
+                    drain(pending.popleft())
+
+            while pending:
+                drain(pending.popleft())
+    finally:
+        store.close()
+
+    elapsed = time.perf_counter() - start
+    summary = {
+        "read": read,
+        "stored": stored,
+        "duplicates": read - stats["failed"] - stored,
+        "skipped": stats["malformed"] + stats["failed"],
+        "seconds": round(elapsed, 2),
+        "postings_per_sec": round(read / max(elapsed, 1e-9)),
+    }
+
+    print(
+        f"✅ Ingested {summary['read']} postings in {summary['seconds']}s "
+        f"({summary['postings_per_sec']} postings/s) | "
+        f"stored: {summary['stored']} | duplicates: {summary['duplicates']} | "
+        f"skipped: {summary['skipped']}"
+    )
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk-ingest job postings into the local job store")
+    parser.add_argument("path", help="JSONL or CSV job dump")
+    parser.add_argument("--store", default=DEFAULT_STORE_PATH, help="SQLite store path")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=500, help="Postings per worker batch")
+    parser.add_argument("--report-every", type=int, default=50000, help="Progress log interval (0 = off)")
+    parser.add_argument("--rebuild", action="store_true", help="Clear a store built with an older skill taxonomy")
+    args = parser.parse_args(argv)
+
+    ingest(args.path, args.store, args.workers, args.batch_size, args.report_every, args.rebuild)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
+import heapq
+
 from analysis_engine import extract_skills, extract_experience_signals
 
 
-def score_job(resume_text, job):
+def weighted_score(resume_skills, resume_exp, job_skills, job_exp, job_title):
     """
     Score job using:
     - Experience match (50%)
@@ -9,15 +11,6 @@ def score_job(resume_text, job):
     - Title similarity (20%)
     """
 
-    resume_skills = extract_skills(resume_text)
-    resume_exp = extract_experience_signals(resume_text)
-
-    job_desc = job.get("description", "") or ""
-    job_title = job.get("title", "").lower()
-
-    job_skills = set(extract_skills(job_desc))
-    job_exp = set(extract_experience_signals(job_desc))
-
     # ---- Experience score (MOST IMPORTANT)
     exp_score = len(resume_exp & job_exp) / max(len(job_exp), 1)
 
@@ -35,6 +28,21 @@ def score_job(resume_text, job):
     )
 
     return round(final_score * 100)
+
+
+def score_job(resume_text, job):
+    resume_skills = extract_skills(resume_text)
+    resume_exp = extract_experience_signals(resume_text)
+
+    job_desc = job.get("description", "") or ""
+    job_title = (job.get("title") or "").lower()
+
+    job_skills = set(extract_skills(job_desc))
+    job_exp = set(extract_experience_signals(job_desc))
+
+    return weighted_score(resume_skills, resume_exp, job_skills, job_exp, job_title)
+
+
 def rank_jobs(resume_text, jobs, min_score=30):
     scored = []
 
@@ -43,8 +51,8 @@ def rank_jobs(resume_text, jobs, min_score=30):
 
         scored.append({
             "title": job.get("title"),
-            "company": job.get("company", {}).get("display_name"),
-            "location": job.get("location", {}).get("display_name"),
+            "company": (job.get("company") or {}).get("display_name"),
+            "location": (job.get("location") or {}).get("display_name"),
             "url": job.get("redirect_url"),
             "score": score
         })
@@ -54,3 +62,50 @@ def rank_jobs(resume_text, jobs, min_score=30):
     strong = [j for j in scored if j["score"] >= min_score]
 
     return strong[:10] if strong else scored[:10]
+
+
+def rank_stored_jobs(resume_text, records, min_score=30):
+    """
+    Same ranking as rank_jobs, but over pre-profiled JobStore records.
+    Streams `records` and keeps only the top 10 in memory.
+    """
+    resume_skills = extract_skills(resume_text)
+    resume_exp = extract_experience_signals(resume_text)
+
+    scored = (
+        {
+            "title": r["title"],
+            "company": r["company"],
+            "location": r["location"],
+            "url": r["url"],
+            "score": weighted_score(
+                resume_skills, resume_exp,
+                r["skills"], r["experience"], (r["title"] or "").lower()
+            ),
+        }
+        for r in records
+    )
+
+    top = heapq.nlargest(10, scored, key=lambda x: x["score"])
+    strong = [j for j in top if j["score"] >= min_score]
+
+    return strong if strong else top
+
+
+def merge_ranked(*ranked_lists, min_score=30):
+    """
+    Merge already-ranked lists (e.g. live Adzuna + job store),
+    dropping the same posting seen in more than one source.
+    """
+    seen, merged = set(), []
+
+    for job in sorted((j for jobs in ranked_lists for j in jobs), key=lambda x: x["score"], reverse=True):
+        key = ((job["title"] or "").lower(), (job["company"] or "").lower())
+        if key in seen:
+            continue
+        seen.add(key)
+        merged.append(job)
+
+    strong = [j for j in merged if j["score"] >= min_score]
+
+    return strong[:10] if strong else merged[:10]
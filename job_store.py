@@ -0,0 +1,177 @@
+import os
+import sqlite3
+import hashlib
+from array import array
+from pathlib import Path
+
+from analysis_engine import SKILL_SYNONYMS, EXPERIENCE_KEYWORDS, TAXONOMY_VERSION
+
+# ==================================================
+# STORE LOCATION
+# ==================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_STORE_PATH = os.path.join(BASE_DIR, "job_store.db")
+
+# ==================================================
+# COMPACT ID ENCODING
+# ==================================================
+# IDs follow taxonomy order — stores record TAXONOMY_VERSION and refuse
+# to decode records written under a different taxonomy.
+SKILL_NAMES = list(SKILL_SYNONYMS)
+SKILL_IDS = {name: i for i, name in enumerate(SKILL_NAMES)}
+
+EXPERIENCE_IDS = {name: i for i, name in enumerate(EXPERIENCE_KEYWORDS)}
+
+
+def encode_ids(names, id_map) -> bytes:
+    return array("H", sorted(id_map[n] for n in names)).tobytes()
+
+
+def decode_ids(blob: bytes, names) -> set:
+    ids = array("H")
+    ids.frombytes(blob or b"")
+    return {names[i] for i in ids}
+
+
+def content_hash(title: str, company: str, description: str) -> str:
+    """
+    Same posting re-exported (new URL, new timestamp) -> same hash
+    """
+    key = "\x1f".join(
+        " ".join((part or "").lower().split())
+        for part in (title, company, description)
+    )
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+# ==================================================
+# SQLITE STORE
+# ==================================================
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    content_hash TEXT PRIMARY KEY,
+    title        TEXT,
+    company      TEXT,
+    location     TEXT,
+    url          TEXT,
+    role         TEXT,
+    skill_ids    BLOB,
+    exp_ids      BLOB
+)
+"""
+
+INDEX = "CREATE INDEX IF NOT EXISTS jobs_role ON jobs (role)"
+
+META = "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+
+COLUMNS = (
+    "content_hash", "title", "company", "location",
+    "url", "role", "skill_ids", "exp_ids",
+)
+
+
+class TaxonomyMismatchError(ValueError):
+    """
+    Store was built with a different skill taxonomy — its IDs can't be trusted.
+    """
+
+
+class JobStore:
+    """
+    Local store of pre-profiled job postings.
+    Duplicate postings (same content hash) are ignored on insert.
+
+    rebuild=True drops records from an older taxonomy instead of raising
+    (postings must then be re-ingested).
+
+    read_only=True never writes (no schema / meta updates) — use it on the
+    request path so /analyze doesn't contend with a running job_ingest.
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, rebuild: bool = False,
+                 read_only: bool = False):
+        self.path = path
+
+        if read_only:
+            self.conn = sqlite3.connect(f"{Path(path).absolute().as_uri()}?mode=ro", uri=True)
+            self._check_taxonomy()
+            return
+
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        self.conn.execute(INDEX)
+        self.conn.execute(META)
+
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'taxonomy'").fetchone()
+
+        if row and row[0] != TAXONOMY_VERSION:
+            if not rebuild:
+                self.conn.close()
+                raise TaxonomyMismatchError(
+                    f"{path} was built with taxonomy {row[0]}, current is {TAXONOMY_VERSION} — re-ingest with --rebuild"
+                )
+            print(f"♻️ Taxonomy changed — clearing {path}")
+            self.conn.execute("DELETE FROM jobs")
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('taxonomy', ?)", (TAXONOMY_VERSION,)
+        )
+        self.conn.commit()
+
+    def _check_taxonomy(self):
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'taxonomy'").fetchone()
+        except sqlite3.Error:
+            row = None
+
+        if not row or row[0] != TAXONOMY_VERSION:
+            self.conn.close()
+            raise TaxonomyMismatchError(
+                f"{self.path} was built with taxonomy {row[0] if row else 'unknown'}, "
+                f"current is {TAXONOMY_VERSION} — re-ingest with --rebuild"
+            )
+
+    def add_records(self, records) -> int:
+        """
+        Insert a batch of record tuples (COLUMNS order).
+        Returns how many were new.
+        """
+        before = self.conn.total_changes
+        self.conn.executemany(
+            f"INSERT OR IGNORE INTO jobs ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+            records,
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def iter_jobs(self, role: str = None, limit: int = None):
+        """
+        Stream stored jobs (decoded) without loading the table into memory.
+        With `limit`, only the most recently ingested `limit` jobs are read.
+        """
+        sql = "SELECT title, company, location, url, role, skill_ids, exp_ids FROM jobs"
+        params = ()
+        if role:
+            sql += " WHERE role = ?"
+            params = (role,)
+        if limit:
+            sql += " ORDER BY rowid DESC LIMIT ?"
+            params += (limit,)
+
+        for title, company, location, url, job_role, skill_ids, exp_ids in self.conn.execute(sql, params):
+            yield {
+                "title": title,
+                "company": company,
+                "location": location,
+                "url": url,
+                "role": job_role,
+                "skills": decode_ids(skill_ids, SKILL_NAMES),
+                "experience": decode_ids(exp_ids, EXPERIENCE_KEYWORDS),
+            }
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,231 @@
+import json
+
+import pytest
+
+pytest.importorskip("google.genai")
+pytest.importorskip("dotenv")
+
+import requests
+
+import gemini_service
+import job_fetcher
+from circuit_breaker import CircuitBreaker, OPEN, CLOSED
+from job_store import JobStore, SKILL_IDS, EXPERIENCE_IDS, encode_ids
+
+RESUME = "Data analyst with python, sql and data analysis. Built dashboard and reporting for stakeholders."
+JD = "Data analyst role: python, sql, tableau, dashboard reporting."
+
+AI_RESPONSE = {
+    "strengths": [{"title": "SQL", "evidence": "sql", "why_it_matters": "core"}],
+    "improvements": [{"area": "Tableau", "priority": "High", "expected_impact": "High", "effort": "Low"}],
+}
+
+ADZUNA_JOB = {
+    "title": "Data Analyst",
+    "company": {"display_name": "Live Co"},
+    "location": {"display_name": "Pune"},
+    "redirect_url": "http://live",
+    "description": "python sql dashboard reporting",
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Upstreams:
+    """
+    Local stubs for Gemini and Adzuna that inject latency on the fake clock.
+    """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.gemini_latency = 0.1
+        self.gemini_calls = 0
+        self.adzuna_latency = 0.1
+        self.adzuna_status = 200
+        self.adzuna_calls = 0
+
+    def generate_content(self, model, contents):
+        self.gemini_calls += 1
+        self.clock.now += self.gemini_latency
+        return type("Response", (), {"text": json.dumps(AI_RESPONSE)})()
+
+    def client(self, api_key, http_options=None):
+        models = type("Models", (), {"generate_content": staticmethod(self.generate_content)})()
+        return type("Client", (), {"models": models})()
+
+    def get(self, url, params=None, timeout=None):
+        self.adzuna_calls += 1
+        self.clock.now += self.adzuna_latency
+        return FakeResponse(self.adzuna_status, {"results": [ADZUNA_JOB]})
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.url = "http://adzuna.test"
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+@pytest.fixture
+def upstreams(monkeypatch, tmp_path):
+    clock = FakeClock()
+    stubs = Upstreams(clock)
+
+    def breaker(name):
+        return CircuitBreaker(name, window=2, min_calls=2, failure_rate=0.5,
+                              slow_call_seconds=1.0, cooldown_seconds=10.0, clock=clock)
+
+    monkeypatch.setattr(gemini_service, "API_KEY", "test-key")
+    monkeypatch.setattr(gemini_service, "GEMINI_BREAKER", breaker("gemini"))
+    monkeypatch.setattr(gemini_service.genai, "Client", stubs.client)
+    monkeypatch.setattr(gemini_service, "DEFAULT_STORE_PATH", str(tmp_path / "job_store.db"))
+
+    monkeypatch.setattr(job_fetcher, "ADZUNA_APP_ID", "id")
+    monkeypatch.setattr(job_fetcher, "ADZUNA_API_KEY", "key")
+    monkeypatch.setattr(job_fetcher, "ADZUNA_BREAKER", breaker("adzuna"))
+    monkeypatch.setattr(job_fetcher, "_JOB_CACHE", {})
+    monkeypatch.setattr(job_fetcher.requests, "get", stubs.get)
+
+    return stubs
+
+
+def fill_store(path):
+    store = JobStore(path)
+    store.add_records([(
+        "h1", "Stored Analyst", "Store Co", "Delhi", "http://stored", "data",
+        encode_ids({"python", "sql"}, SKILL_IDS),
+        encode_ids({"dashboard", "reporting"}, EXPERIENCE_IDS),
+    )])
+    store.close()
+
+
+def test_healthy_upstreams_use_ai_and_live_jobs(upstreams):
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert result["ai_improvements"][0]["source"] == "ai"
+    assert [j["url"] for j in result["recommended_jobs"]] == ["http://live"]
+    assert result["degraded"] == {"gemini": False, "adzuna": False}
+
+
+def test_slow_gemini_is_shed_and_falls_back_to_skill_gaps(upstreams):
+    upstreams.gemini_latency = 5.0
+
+    gemini_service.analyze_resume(RESUME, JD)
+    gemini_service.analyze_resume(RESUME, JD)
+    assert gemini_service.GEMINI_BREAKER.state == OPEN
+
+    calls = upstreams.gemini_calls
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert upstreams.gemini_calls == calls
+    assert result["degraded"]["gemini"] is True
+    assert result["ai_strengths"] == []
+    assert result["ai_improvements"]
+    assert all(i["source"] == "skill_gap" for i in result["ai_improvements"])
+    assert gemini_service.GEMINI_BREAKER.snapshot()["shed_count"] == 1
+
+
+def test_gemini_error_reports_degraded(upstreams, monkeypatch):
+    def timeout(model, contents):
+        upstreams.clock.now += 0.5
+        raise TimeoutError("gemini timed out")
+
+    monkeypatch.setattr(upstreams, "generate_content", timeout)
+
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert gemini_service.GEMINI_BREAKER.state == CLOSED
+    assert result["degraded"]["gemini"] is True
+    assert all(i["source"] == "skill_gap" for i in result["ai_improvements"])
+
+
+def test_gemini_recovers_through_half_open_probe(upstreams):
+    upstreams.gemini_latency = 5.0
+    gemini_service.analyze_resume(RESUME, JD)
+    gemini_service.analyze_resume(RESUME, JD)
+
+    upstreams.gemini_latency = 0.1
+    upstreams.clock.now += 10.0
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert gemini_service.GEMINI_BREAKER.state == CLOSED
+    assert result["degraded"]["gemini"] is False
+    assert result["ai_improvements"][0]["source"] == "ai"
+
+
+def test_adzuna_errors_open_breaker_and_serve_cached_jobs(upstreams):
+    gemini_service.analyze_resume(RESUME, JD)  # primes the job cache
+
+    upstreams.adzuna_status = 503
+    gemini_service.analyze_resume(RESUME, JD)
+
+    # 1 good + 1 503 in a window of 2 reaches the 50% failure rate
+    snapshot = job_fetcher.ADZUNA_BREAKER.snapshot()
+    assert snapshot["state"] == OPEN
+    assert snapshot["failure_rate"] == 0.5
+
+    calls = upstreams.adzuna_calls
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert upstreams.adzuna_calls == calls
+    assert result["degraded"]["adzuna"] is True
+    assert [j["url"] for j in result["recommended_jobs"]] == ["http://live"]
+
+
+def test_slow_adzuna_falls_back_to_job_store(upstreams):
+    fill_store(gemini_service.DEFAULT_STORE_PATH)
+    upstreams.adzuna_latency = 5.0
+
+    gemini_service.analyze_resume(RESUME, JD)
+    gemini_service.analyze_resume(RESUME, JD)
+    job_fetcher._JOB_CACHE.clear()
+
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert job_fetcher.ADZUNA_BREAKER.state == OPEN
+    assert result["degraded"]["adzuna"] is True
+    assert [j["url"] for j in result["recommended_jobs"]] == ["http://stored"]
+
+
+def test_missing_adzuna_credentials_is_not_degraded(upstreams, monkeypatch):
+    fill_store(gemini_service.DEFAULT_STORE_PATH)
+    monkeypatch.setattr(job_fetcher, "ADZUNA_APP_ID", None)
+
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert upstreams.adzuna_calls == 0
+    assert result["degraded"]["adzuna"] is False
+    assert [j["url"] for j in result["recommended_jobs"]] == ["http://stored"]
+
+
+def test_corrupt_job_store_does_not_break_analysis(upstreams):
+    with open(gemini_service.DEFAULT_STORE_PATH, "wb") as f:
+        f.write(b"this is not a sqlite database" * 10)
+
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert result["ats_score"] > 0
+    assert result["ai_improvements"][0]["source"] == "ai"
+    assert [j["url"] for j in result["recommended_jobs"]] == ["http://live"]
+
+
+def test_null_company_in_adzuna_posting(upstreams, monkeypatch):
+    monkeypatch.setitem(ADZUNA_JOB, "company", None)
+
+    result = gemini_service.analyze_resume(RESUME, JD)
+
+    assert result["recommended_jobs"][0]["company"] is None
+    assert result["ats_score"] > 0
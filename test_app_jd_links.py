@@ -0,0 +1,128 @@
+import io
+import os
+import sqlite3
+
+import pytest
+
+pytest.importorskip("flask")
+pytest.importorskip("google.genai")
+pytest.importorskip("bs4")
+pytest.importorskip("PyPDF2")
+
+import requests
+
+import app as app_module
+import jd_parser
+from jd_profile import JDProfileStore
+
+JD = "Technical support engineer: incident management, SLA, ServiceNow, escalation handling."
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    store_path = str(tmp_path / "jd.db")
+    calls = []
+
+    def fake_analyze(resume_text, job_description, jd_profile=None):
+        calls.append(jd_profile)
+        return {"ats_score": 50, "jd_role": jd_profile["jd_role"]}
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(app_module, "JD_PUBLISH_TOKEN", "secret")
+    monkeypatch.setattr(app_module, "JDProfileStore", lambda: JDProfileStore(store_path))
+    monkeypatch.setattr(app_module, "extract_resume_text", lambda path: "incident escalation sla")
+    monkeypatch.setattr(app_module, "analyze_resume", fake_analyze)
+
+    def store_count():
+        store = JDProfileStore(store_path)
+        try:
+            return store.count()
+        finally:
+            store.close()
+
+    test_client = app_module.app.test_client()
+    test_client.calls = calls
+    test_client.store_count = store_count
+    test_client.store_path = store_path
+    return test_client
+
+
+def resume_upload():
+    return (io.BytesIO(b"%PDF-1.4 stub"), "resume.pdf")
+
+
+def test_publish_requires_token(client):
+    response = client.post("/jd/publish", json={"job_description": JD})
+
+    assert response.status_code == 403
+    assert client.store_count() == 0
+
+
+def test_shared_link_analyzes_with_stored_profile(client):
+    published = client.post(
+        "/jd/publish", json={"job_description": JD}, headers={"X-Publish-Token": "secret"}
+    ).get_json()
+
+    assert published["jd_role"] == "support"
+    assert f"jd={published['jd_id']}" in published["share_url"]
+
+    page = client.get(f"/analyze?jd={published['jd_id']}")
+    assert f'value="{published["jd_id"]}"' in page.get_data(as_text=True)
+
+    client.post("/analyze", data={"jd_id": published["jd_id"], "resume": resume_upload()})
+
+    assert client.calls[-1]["jd_id"] == published["jd_id"]
+    assert client.calls[-1]["jd_text"] == JD
+    with client.session_transaction() as session:
+        assert session["result"]["jd_role"] == "support"
+
+
+def test_pasted_jd_never_opens_store(client):
+    client.post("/analyze", data={"job_description": JD, "resume": resume_upload()})
+
+    assert client.calls[-1]["jd_role"] == "support"
+    assert not os.path.exists(client.store_path)
+
+
+class FakePage:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+@pytest.mark.parametrize("page", [
+    FakePage(403, "<p>Sign in to view this job</p>"),
+    FakePage(200, "<div>No paragraphs here</div>"),
+])
+def test_failed_or_empty_jd_link_is_not_cached(client, monkeypatch, page):
+    monkeypatch.setattr(jd_parser.requests, "get", lambda url, timeout=None: page)
+
+    response = client.post(
+        "/jd/publish", json={"jd_url": "http://jobs/1"}, headers={"X-Publish-Token": "secret"}
+    )
+    assert response.status_code == 400
+
+    client.post("/analyze", data={"jd_url": "http://jobs/1", "resume": resume_upload()})
+
+    assert client.calls == []
+    with client.session_transaction() as session:
+        assert session["result"]["error"]
+    assert client.store_count() == 0
+
+
+def test_store_failure_still_removes_resume(client, monkeypatch):
+    def broken_store():
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(app_module, "JDProfileStore", broken_store)
+
+    response = client.post("/analyze", data={"jd_id": "abc", "resume": resume_upload()})
+
+    assert response.status_code == 302
+    assert not os.path.exists(app_module.UPLOAD_RESUME_PATH)
+    with client.session_transaction() as session:
+        assert "locked" in session["result"]["error"]
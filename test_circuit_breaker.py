@@ -0,0 +1,138 @@
+import pytest
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def slow_upstream(clock, latency):
+    # Stub upstream: "takes" `latency` seconds on the fake clock
+    def call():
+        clock.now += latency
+        return "ok"
+    return call
+
+
+def failing_upstream():
+    raise TimeoutError("upstream timed out")
+
+
+def make_breaker(clock):
+    return CircuitBreaker(
+        "stub", window=4, min_calls=4, failure_rate=0.5,
+        slow_call_seconds=1.0, cooldown_seconds=10.0, clock=clock
+    )
+
+
+def test_slow_calls_open_breaker_and_shed():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(4):
+        breaker.call(slow_upstream(clock, 2.0))
+
+    assert breaker.state == OPEN
+
+    called = []
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: called.append(1))
+
+    assert called == []
+    assert breaker.snapshot()["shed_count"] == 1
+
+
+def test_errors_open_breaker():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for fn in (failing_upstream, failing_upstream, slow_upstream(clock, 0.1), slow_upstream(clock, 0.1)):
+        try:
+            breaker.call(fn)
+        except TimeoutError:
+            pass
+
+    assert breaker.state == OPEN
+
+
+def test_fast_calls_keep_breaker_closed():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(10):
+        assert breaker.call(slow_upstream(clock, 0.1)) == "ok"
+
+    assert breaker.state == CLOSED
+
+
+def test_half_open_probe_recovers():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(4):
+        breaker.call(slow_upstream(clock, 2.0))
+
+    clock.now += 10.0
+    assert breaker.state == HALF_OPEN
+
+    # Only one probe is let through while half-open
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record(0.1, ok=True, probe=True)
+    assert breaker.state == CLOSED
+
+
+def test_half_open_ignores_stragglers():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(4):
+        breaker.call(slow_upstream(clock, 2.0))
+
+    clock.now += 10.0
+    assert breaker.allow()
+
+    # Fast result from a call admitted before the breaker opened
+    breaker.record(0.1, ok=True)
+    assert breaker.state == HALF_OPEN
+
+    breaker.record(5.0, ok=True, probe=True)
+    assert breaker.state == OPEN
+
+
+def test_interrupted_probe_reopens():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(4):
+        breaker.call(slow_upstream(clock, 2.0))
+
+    clock.now += 10.0
+
+    def interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        breaker.call(interrupted)
+
+    assert breaker.state == OPEN
+
+
+def test_half_open_probe_failure_reopens():
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+
+    for _ in range(4):
+        breaker.call(slow_upstream(clock, 2.0))
+
+    clock.now += 10.0
+    breaker.call(slow_upstream(clock, 5.0))
+
+    assert breaker.state == OPEN
+    assert breaker.snapshot()["open_count"] == 2
@@ -0,0 +1,145 @@
+import time
+import sqlite3
+
+import pytest
+
+import jd_profile
+from analysis_engine import calculate_ats_score, TAXONOMY_VERSION
+from jd_profile import JDProfileStore, transient_profile, jd_hash
+
+RESUME = "Support engineer handling incident escalation, SLA tracking and zendesk tickets. Python scripts for reporting."
+
+JDS = [
+    "Technical support engineer: incident management, SLA, ServiceNow, escalation handling.",
+    "Data analyst with Python, SQL, Tableau and stakeholder reporting.",
+    "Digital marketing executive — SEO, Google Ads, copywriting.",
+    "Office coordinator, scheduling and travel booking.",
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = JDProfileStore(str(tmp_path / "jd.db"))
+    yield s
+    s.close()
+
+
+def age_row(store, jd_id, seconds):
+    store.conn.execute(
+        "UPDATE jd_profiles SET updated_at = ? WHERE jd_id = ?", (time.time() - seconds, jd_id)
+    )
+    store.conn.commit()
+
+
+@pytest.mark.parametrize("jd", JDS)
+def test_stored_profile_scores_like_raw_jd(store, jd):
+    expected = calculate_ats_score(RESUME, jd)
+
+    saved = store.save(jd)
+    assert calculate_ats_score(RESUME, jd, saved) == expected
+
+    loaded = store.get(saved["jd_id"])
+    assert calculate_ats_score(RESUME, loaded["jd_text"], loaded) == expected
+
+    assert calculate_ats_score(RESUME, jd, transient_profile(jd)) == expected
+
+
+def test_get_by_url_and_expiry(store):
+    saved = store.save(JDS[0], url="http://jobs/1")
+
+    assert store.get_by_url("http://jobs/1")["jd_id"] == saved["jd_id"]
+    assert store.get_by_url("http://jobs/other") is None
+
+    age_row(store, saved["jd_id"], 60)
+    assert store.get_by_url("http://jobs/1", max_age=30) is None
+    assert store.get_by_url("http://jobs/1", max_age=120) is not None
+
+
+def test_published_profiles_expire(store):
+    saved = store.save(JDS[1])
+    age_row(store, saved["jd_id"], jd_profile.PROFILE_MAX_AGE_SECONDS + 1)
+
+    assert store.get(saved["jd_id"]) is None
+
+
+def test_resave_refreshes_age_and_keeps_url(store):
+    saved = store.save(JDS[0], url="http://jobs/1")
+    age_row(store, saved["jd_id"], 3600)
+
+    again = store.save(JDS[0])
+
+    assert again["url"] == "http://jobs/1"
+    assert time.time() - again["updated_at"] < 60
+    assert store.count() == 1
+
+
+def test_taxonomy_mismatch_rebuilds_profile(store):
+    saved = store.save(JDS[0])
+    store.conn.execute(
+        "UPDATE jd_profiles SET taxonomy = 'old', jd_role = 'marketing', skill_ids = ? WHERE jd_id = ?",
+        (b"", saved["jd_id"]),
+    )
+    store.conn.commit()
+
+    loaded = store.get(saved["jd_id"])
+
+    assert loaded["jd_role"] == saved["jd_role"]
+    assert loaded["jd_skills"] == saved["jd_skills"]
+    row = store.conn.execute("SELECT taxonomy FROM jd_profiles WHERE jd_id = ?", (saved["jd_id"],)).fetchone()
+    assert row[0] == TAXONOMY_VERSION
+
+
+def test_store_without_taxonomy_column_migrates(tmp_path):
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE jd_profiles (jd_id TEXT PRIMARY KEY, url TEXT, jd_text TEXT, "
+        "jd_role TEXT, skill_ids BLOB, jd_words TEXT, updated_at REAL)"
+    )
+    conn.execute(
+        "INSERT INTO jd_profiles VALUES (?, NULL, ?, 'generic', ?, '', ?)",
+        (jd_hash(JDS[1]), JDS[1], b"", time.time()),
+    )
+    conn.commit()
+    conn.close()
+
+    store = JDProfileStore(path)
+    try:
+        loaded = store.get(jd_hash(JDS[1]))
+    finally:
+        store.close()
+
+    assert loaded["jd_role"] == "data"
+    assert "sql" in loaded["jd_skills"]
+
+
+def test_prune_caps_size_and_age(store, monkeypatch):
+    monkeypatch.setattr(jd_profile, "MAX_PROFILES", 2)
+
+    first = store.save(JDS[0])
+    age_row(store, first["jd_id"], 20)
+    second = store.save(JDS[1])
+    age_row(store, second["jd_id"], 10)
+    store.save(JDS[2])
+
+    assert store.count() == 2
+    assert store.get(first["jd_id"]) is None
+
+    age_row(store, second["jd_id"], jd_profile.PROFILE_MAX_AGE_SECONDS + 1)
+    store.save(JDS[3])
+
+    assert store.count() == 2
+    assert store.get(second["jd_id"], max_age=float("inf")) is None
+
+
+def test_rejects_oversized_jd(store):
+    with pytest.raises(ValueError):
+        store.save("x" * (jd_profile.MAX_JD_CHARS + 1))
+
+
+@pytest.mark.parametrize("jd", ["", "   \n "])
+def test_rejects_empty_jd(store, jd):
+    with pytest.raises(ValueError):
+        store.save(jd, url="http://jobs/empty")
+
+    assert store.get_by_url("http://jobs/empty") is None
@@ -0,0 +1,205 @@
+import csv
+import json
+import sqlite3
+
+import pytest
+
+from job_ingest import iter_postings, profile_batch, ingest
+from job_matcher import merge_ranked
+from job_store import (
+    JobStore, TaxonomyMismatchError, SKILL_NAMES, SKILL_IDS,
+    encode_ids, decode_ids, content_hash,
+)
+
+
+def write_jsonl(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(row if isinstance(row, str) else json.dumps(row))
+            f.write("\n")
+
+
+def test_skill_ids_round_trip():
+    skills = {"python", "sql", "crm", "problem solving"}
+    assert decode_ids(encode_ids(skills, SKILL_IDS), SKILL_NAMES) == skills
+    assert decode_ids(encode_ids(set(), SKILL_IDS), SKILL_NAMES) == set()
+
+
+def test_content_hash_ignores_case_and_whitespace():
+    assert content_hash("Data Analyst", "Acme", "python  sql") == content_hash("data analyst ", "ACME", "python sql")
+    assert content_hash("Data Analyst", "Acme", "python") != content_hash("Data Analyst", "Other", "python")
+
+
+def test_jsonl_reader_normalizes_and_counts_malformed(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    write_jsonl(path, [
+        {"title": "Analyst", "company": {"display_name": "Acme"}, "redirect_url": "http://a", "description": "sql"},
+        {"title": 123, "description": None},
+        "not json",
+        "[1, 2]",
+        "",
+    ])
+
+    stats = {}
+    postings = list(iter_postings(str(path), stats))
+
+    assert postings[0] == {
+        "title": "Analyst", "company": "Acme", "location": "",
+        "url": "http://a", "description": "sql",
+    }
+    assert postings[1]["title"] == "123"
+    assert postings[1]["description"] == ""
+    assert stats["malformed"] == 2
+
+
+def test_jsonl_reader_skips_undecodable_lines(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    path.write_bytes(
+        b'{"title": "First"}\n'
+        b'{"title": "Bad \xff byte"}\n'
+        b'{"title": "Third"}\n'
+    )
+
+    stats = {}
+    titles = [p["title"] for p in iter_postings(str(path), stats)]
+
+    assert titles == ["First", "Third"]
+    assert stats["malformed"] == 1
+
+
+def test_csv_reader_skips_bad_rows(tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_bytes(
+        b"title,description\n"
+        b"Analyst,python\n"
+        b"Oversized," + b"x" * 100 + b"\n"
+        b"Caf\xe9 Manager,crm\n"
+    )
+
+    stats = {}
+    limit = csv.field_size_limit(50)
+    try:
+        postings = list(iter_postings(str(path), stats))
+    finally:
+        csv.field_size_limit(limit)
+
+    assert [p["title"] for p in postings] == ["Analyst", "Caf\ufffd Manager"]
+    assert stats["malformed"] == 1
+
+
+def test_csv_reader(tmp_path):
+    path = tmp_path / "jobs.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=["title", "company", "location", "url", "description"])
+        writer.writeheader()
+        writer.writerow({"title": "Support Engineer", "company": "Acme", "location": "Pune",
+                         "url": "http://s", "description": "incident, sla, zendesk"})
+
+    postings = list(iter_postings(str(path)))
+
+    assert len(postings) == 1
+    assert postings[0]["company"] == "Acme"
+    assert postings[0]["location"] == "Pune"
+
+
+def test_profile_batch_skips_bad_postings():
+    good = {"title": "Analyst", "company": "Acme", "location": "", "url": "", "description": "python"}
+    records, failed = profile_batch([good, {"title": "missing fields"}])
+
+    assert len(records) == 1
+    assert failed == 1
+
+
+def test_ingest_dedupes_and_stores(tmp_path):
+    path = tmp_path / "jobs.jsonl"
+    posting = {"title": "Data Analyst", "company": "Acme", "description": "python sql dashboard reporting"}
+    write_jsonl(path, [
+        posting,
+        dict(posting, redirect_url="http://repost"),  # same content, new URL
+        {"title": "Support Engineer", "company": "Acme", "description": "incident escalation sla"},
+        {"title": 123, "description": 456},
+        "broken",
+    ])
+    store_path = str(tmp_path / "store.db")
+
+    summary = ingest(str(path), store_path, workers=1, batch_size=2, report_every=0)
+
+    assert summary["read"] == 4
+    assert summary["stored"] == 3
+    assert summary["duplicates"] == 1
+    assert summary["skipped"] == 1
+
+    store = JobStore(store_path)
+    try:
+        jobs = {j["title"]: j for j in store.iter_jobs()}
+    finally:
+        store.close()
+
+    assert jobs["Data Analyst"]["skills"] == {"python", "sql"}
+    assert jobs["Data Analyst"]["experience"] == {"dashboard", "reporting"}
+    assert jobs["Data Analyst"]["role"] == "data"
+
+
+def test_store_refuses_other_taxonomy(tmp_path):
+    store_path = str(tmp_path / "store.db")
+    JobStore(store_path).close()
+
+    conn = sqlite3.connect(store_path)
+    conn.execute("UPDATE meta SET value = 'old' WHERE key = 'taxonomy'")
+    conn.execute("INSERT INTO jobs (content_hash, title) VALUES ('h', 'stale')")
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(TaxonomyMismatchError):
+        JobStore(store_path)
+
+    store = JobStore(store_path, rebuild=True)
+    try:
+        assert store.count() == 0
+    finally:
+        store.close()
+
+
+def test_read_only_store(tmp_path):
+    store_path = str(tmp_path / "store.db")
+
+    with pytest.raises(sqlite3.OperationalError):
+        JobStore(store_path, read_only=True)
+    assert not (tmp_path / "store.db").exists()
+
+    store = JobStore(store_path)
+    store.add_records([("h", "Analyst", "", "", "", "data", b"", b"")])
+    store.close()
+
+    store = JobStore(store_path, read_only=True)
+    try:
+        assert [j["title"] for j in store.iter_jobs("data")] == ["Analyst"]
+        with pytest.raises(sqlite3.OperationalError):
+            store.add_records([("h2", "Other", "", "", "", "data", b"", b"")])
+    finally:
+        store.close()
+
+
+def test_read_only_store_refuses_other_taxonomy(tmp_path):
+    store_path = str(tmp_path / "store.db")
+    JobStore(store_path).close()
+
+    conn = sqlite3.connect(store_path)
+    conn.execute("UPDATE meta SET value = 'old' WHERE key = 'taxonomy'")
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(TaxonomyMismatchError):
+        JobStore(store_path, read_only=True)
+
+
+def test_merge_ranked_dedupes_across_sources():
+    live = [{"title": "Analyst", "company": "Acme", "location": "", "url": "a", "score": 60}]
+    stored = [
+        {"title": "analyst", "company": "ACME", "location": "", "url": "b", "score": 50},
+        {"title": "BI Analyst", "company": "Other", "location": "", "url": "c", "score": 70},
+    ]
+
+    merged = merge_ranked(live, stored)
+
+    assert [j["url"] for j in merged] == ["c", "a"]